@@ -13,6 +13,11 @@ DEFAULT_MAX_STORAGE = 500
 DEFAULT_INITIAL_INVENTORY = 0
 DEFAULT_DEMAND = "100,20,100,20,100,20,100,20,100,20,100,20"
 
+# Solved problems kept for reuse across runs (least recently used dropped first)
+SOLVER_CACHE_SIZE = 16
+# How often (ms) the GUI checks whether a background solve has finished
+SOLVER_POLL_MS = 20
+
 # UI Constants
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 850
@@ -51,15 +51,6 @@ class ClassicDPVerifier:
         # --- 2. COST CALCULATION ---
         demand = self.demand[t]
         inv_after = I + q
-        
-        # Constraint B: Physics - Warehouse Capacity
-        # Even if logic allows ordering, does it fit?
-        if inv_after - demand > self.max_storage:
-             # Note: Usually we check inv_after > max, but strictly 
-             # ending inventory is what matters for storage cost.
-             # However, physically fitting the shipment matters too.
-             # We stick to your logic: "next_inv > max_storage" check.
-             pass 
 
         # Immediate Cost
         order_cost = (self.c_order_fixed + self.c_unit * q) if q > 0 else 0
@@ -77,6 +68,7 @@ class ClassicDPVerifier:
         immediate_cost = order_cost + emergency_cost + holding_cost
         
         # Future Cost
+        # Constraint B: Ending inventory must fit in the warehouse
         if next_inv > self.max_storage:
             return float('inf'), False
             
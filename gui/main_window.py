@@ -3,14 +3,18 @@
 Main application window and solver orchestration.
 """
 
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk, messagebox
 
+import numpy as np
+
 from models.inventory_solver import InventoryDPSolver
 from gui.tabs.main_tab import MainTab
 from gui.tabs.dp_visualization_tab import DPVisualizationTab
 from gui.tabs.comparison_tab import ComparisonTab
-from gui.widgets.plot_manager import PlotManager
+from gui.widgets.plot_manager import PlotManager, schedule_data
 from Utils.constant import *
 
 
@@ -26,9 +30,14 @@ class InventoryGUI(tk.Tk):
         # State variables
         self.current_demand = None
         self.current_schedule = None
+        self.current_data = None
         self.current_cost = None
         self.solver = None
+        # Solvers of recent problems, keyed by everything but the initial inventory
+        self.solver_cache = OrderedDict()
+        self.solving = False
         self.greedy_schedule = None
+        self.greedy_data = None
         self.greedy_cost = None
 
         # Widget references (will be set by tabs)
@@ -40,6 +49,7 @@ class InventoryGUI(tk.Tk):
         self.c_emergency_fixed = None
         self.c_emergency_unit = None
         self.max_storage = None
+        self.run_button = None
         self.table = None
         self.log = None
         self.dp_tree = None
@@ -73,6 +83,8 @@ class InventoryGUI(tk.Tk):
         """
         Main solver orchestration: parse inputs, solve with DP and Greedy,
         update all displays.
+        New problems are solved on a background thread and displayed once
+        it finishes; recently solved ones are displayed right away.
         """
         # Parse and validate inputs
         try:
@@ -92,6 +104,25 @@ class InventoryGUI(tk.Tk):
             messagebox.showerror("Input Error", str(e))
             return
 
+        # One solve at a time; the Run button is disabled meanwhile
+        if self.solving:
+            return
+
+        # The DP table covers every starting inventory, so a run of any
+        # recently solved problem reuses that solve, whatever the initial
+        # inventory.
+        problem = (
+            tuple(demand), max_storage,
+            c_order_fixed, c_unit, c_storage,
+            c_emergency_fixed, c_emergency_unit
+        )
+        solver = self.solver_cache.get(problem)
+        if solver is not None:
+            self.solver_cache.move_to_end(problem)
+            solver.initial_inventory = init_inv
+            self.show_results(solver, demand)
+            return
+
         # Create solver
         solver = InventoryDPSolver(
             T, demand, max_storage, init_inv,
@@ -99,8 +130,52 @@ class InventoryGUI(tk.Tk):
             c_emergency_fixed, c_emergency_unit
         )
 
-        # Solve with DP
-        solver.solve()
+        # Solve with DP on a worker thread so the window keeps repainting
+        # during large solves; the Tk main loop polls for the result.
+        errors = []
+        worker = threading.Thread(
+            target=self._solve_worker, args=(solver, errors), daemon=True
+        )
+        self.set_solving(True)
+        worker.start()
+        self.after(SOLVER_POLL_MS, self._wait_for_solver,
+                   worker, errors, problem, solver, demand)
+
+    @staticmethod
+    def _solve_worker(solver, errors):
+        """Thread body: run the DP sweep, recording any failure for the main thread."""
+        try:
+            solver.solve()
+        except Exception as e:
+            errors.append(e)
+
+    def _wait_for_solver(self, worker, errors, problem, solver, demand):
+        """Poll the solver thread from the Tk main loop; show results once it finishes."""
+        if worker.is_alive():
+            self.after(SOLVER_POLL_MS, self._wait_for_solver,
+                       worker, errors, problem, solver, demand)
+            return
+
+        self.set_solving(False)
+        if errors:
+            messagebox.showerror("Solver Error", str(errors[0]))
+            return
+
+        self.solver_cache[problem] = solver
+        if len(self.solver_cache) > SOLVER_CACHE_SIZE:
+            self.solver_cache.popitem(last=False)
+
+        self.show_results(solver, demand)
+
+    def set_solving(self, solving):
+        """Toggle the busy state: watch cursor and a disabled Run button while solving."""
+        self.solving = solving
+        self.config(cursor="watch" if solving else "")
+        if self.run_button is not None:
+            self.run_button.state(["disabled"] if solving else ["!disabled"])
+
+    def show_results(self, solver, demand):
+        """Backtrack the solved DP, run Greedy and update all displays."""
         schedule, cost = solver.backtrack()
 
         # Solve with Greedy
@@ -113,6 +188,9 @@ class InventoryGUI(tk.Tk):
         self.solver = solver
         self.greedy_schedule = greedy_schedule
         self.greedy_cost = greedy_cost
+        # Column arrays for the plots, extracted once per run
+        self.current_data = schedule_data(schedule)
+        self.greedy_data = schedule_data(greedy_schedule)
 
         # Update displays
         self.update_main_table(schedule, cost, demand)
@@ -127,25 +205,25 @@ class InventoryGUI(tk.Tk):
             # Clear table
             self.table.delete(*self.table.get_children())
             
-            emergency_count = 0
-            total_ordered = 0
-            total_emergency = 0
+            # Summary figures straight from the schedule columns
+            orders = schedule["Order"]
+            emergencies = schedule["Emergency"]
+            emergency_count = int(np.count_nonzero(emergencies))
+            regular_orders = int(np.count_nonzero(orders))
+            total_ordered = int(orders.sum())
+            total_emergency = int(emergencies.sum())
+            total_demand = sum(demand)
             
-            for s in schedule:
-                if s["Emergency"] > 0:
-                    emergency_count += 1
-                    total_emergency += s["Emergency"]
-                
-                total_ordered += s["Order"]
-                
+            # tolist() turns the records into plain tuples in one call
+            for period, start, order, period_demand, emergency, end, period_cost in schedule.tolist():
                 self.table.insert("", "end", values=(
-                    s["Period"], 
-                    s["Start"], 
-                    s["Order"],
-                    s["Demand"],
-                    f"🚨 {s['Emergency']}" if s["Emergency"] else "-",
-                    s["End"],
-                    f"${s['Cost']:.2f}"
+                    period, 
+                    start, 
+                    order,
+                    period_demand,
+                    f"🚨 {emergency}" if emergency else "-",
+                    end,
+                    f"${period_cost:.2f}"
                 ))
             
             # Update log with detailed summary
@@ -154,18 +232,17 @@ class InventoryGUI(tk.Tk):
             self.log.insert(tk.END, "║        OPTIMIZATION RESULTS               ║\n")
             self.log.insert(tk.END, "╚═══════════════════════════════════════════╝\n\n")
             self.log.insert(tk.END, f"✅ Optimal Total Cost: ${cost:,.2f}\n")
-            self.log.insert(tk.END, f"📊 Total Demand: {sum(demand):,} units\n")
+            self.log.insert(tk.END, f"📊 Total Demand: {total_demand:,} units\n")
             self.log.insert(tk.END, f"📦 Total Ordered: {total_ordered:,} units\n")
             self.log.insert(tk.END, f"🚨 Emergency Orders: {emergency_count} periods\n")
             self.log.insert(tk.END, f"⚡ Emergency Units: {total_emergency:,} units\n")
             self.log.insert(tk.END, f"💰 Average Cost/Period: ${cost/T:.2f}\n")
             
             # Add efficiency metrics
-            regular_orders = sum(1 for s in schedule if s["Order"] > 0)
             self.log.insert(tk.END, f"📅 Regular Orders: {regular_orders} periods\n")
             
             if total_ordered > 0:
-                fulfillment_rate = (sum(demand) - total_emergency) / sum(demand) * 100
+                fulfillment_rate = (total_demand - total_emergency) / total_demand * 100
                 self.log.insert(tk.END, f"✓ Fulfillment Rate: {fulfillment_rate:.1f}%\n")
             
         except Exception as e:
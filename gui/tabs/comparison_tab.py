@@ -107,11 +107,8 @@ class ComparisonTab:
         savings = greedy_cost - dp_cost
         improvement = (savings / greedy_cost) * 100 if greedy_cost > 0 else 0
 
-        dp_orders = sum(s["Order"] for s in dp_schedule)
-        greedy_orders = sum(s["Order"] for s in greedy_schedule)
-
-        dp_emergencies = sum(s["Emergency"] for s in dp_schedule)
-        greedy_emergencies = sum(s["Emergency"] for s in greedy_schedule)
+        dp_orders, dp_emergencies = self._unit_totals(dp_schedule)
+        greedy_orders, greedy_emergencies = self._unit_totals(greedy_schedule)
 
         summary = f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -139,5 +136,10 @@ Conclusion:
 """
         self.parent.comparison_text.insert("1.0", summary)
 
+    @staticmethod
+    def _unit_totals(schedule):
+        """Total ordered and emergency units of a schedule (column sums)."""
+        return int(schedule["Order"].sum()), int(schedule["Emergency"].sum())
+
     def get_frame(self):
         return self.frame
\ No newline at end of file
@@ -1,6 +1,5 @@
-import tkinter as tk
 from tkinter import ttk
-import numpy as np
+import math
 
 class DPVisualizationTab:
     """DP table visualization tab."""
@@ -70,17 +69,12 @@ class DPVisualizationTab:
             self.gui.dp_tree.heading(c, text=c)
             self.gui.dp_tree.column(c, width=80, anchor="center")
         
-        for item in self.gui.dp_tree.get_children():
-            self.gui.dp_tree.delete(item)
+        self.gui.dp_tree.delete(*self.gui.dp_tree.get_children())
         
-        for t in range(dp_display.shape[0]):
-            row = [f"t={t}"]
-            for i in range(dp_display.shape[1]):
-                val = dp_display[t, i]
-                if np.isinf(val):
-                    row.append("inf")
-                else:
-                    row.append(f"{val:.1f}")
+        # Format whole rows from plain Python values (one tolist() per
+        # table) instead of indexing NumPy scalars cell by cell
+        for t, values in enumerate(dp_display.tolist()):
+            row = [f"t={t}"] + ["inf" if math.isinf(val) else f"{val:.1f}" for val in values]
             self.gui.dp_tree.insert("", "end", values=row)
     
     def display_decision_table(self, decision):
@@ -92,13 +86,10 @@ class DPVisualizationTab:
             self.gui.decision_tree.heading(c, text=c)
             self.gui.decision_tree.column(c, width=80, anchor="center")
         
-        for item in self.gui.decision_tree.get_children():
-            self.gui.decision_tree.delete(item)
+        self.gui.decision_tree.delete(*self.gui.decision_tree.get_children())
         
-        for t in range(decision.shape[0]):
-            row = [f"t={t}"]
-            for i in range(decision.shape[1]):
-                row.append(f"{int(decision[t, i])}")
+        for t, values in enumerate(decision.tolist()):
+            row = [f"t={t}"] + [str(q) for q in values]
             self.gui.decision_tree.insert("", "end", values=row)
     
     def get_frame(self):
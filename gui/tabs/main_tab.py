@@ -1,4 +1,3 @@
-import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter.scrolledtext import ScrolledText
 from Utils.constant import (
@@ -10,12 +9,10 @@ from Utils.constant import (
     DEFAULT_EMERGENCY_FIXED,
     DEFAULT_EMERGENCY_UNIT,
     DEFAULT_MAX_STORAGE,
-    SCHEDULE_COLUMNS
+    SCHEDULE_COLUMNS,
+    T
 )
 
-# Explicitly restoring T to 12 as requested
-T = 12
-
 class MainTab:
     """Main optimization tab."""
     
@@ -52,8 +49,8 @@ class MainTab:
         self.gui.init_inv.grid(row=1, column=1, sticky="w")
 
         # --- Row 2: Run Button ---
-        ttk.Button(frame, text="Run Optimization", command=self.validate_and_run)\
-            .grid(row=2, column=1, sticky="w", pady=5)
+        self.gui.run_button = ttk.Button(frame, text="Run Optimization", command=self.validate_and_run)
+        self.gui.run_button.grid(row=2, column=1, sticky="w", pady=5)
 
         # --- Row 3: Ordering Fixed Cost ---
         ttk.Label(frame, text="Ordering Fixed Cost:").grid(row=3, column=0, sticky="w")
@@ -1,6 +1,43 @@
+from collections import namedtuple
+
 import numpy as np
-import matplotlib.pyplot as plt
 from tkinter import messagebox
+from Utils.constant import SCHEDULE_COLUMNS
+
+# pyplot is imported on the first plot rather than at GUI startup
+_plt = None
+
+
+def _pyplot():
+    """Return matplotlib.pyplot, importing it on first use."""
+    global _plt
+    if _plt is None:
+        import matplotlib
+
+        # The plots open next to a Tk app, so pin the Tk backend instead of
+        # letting pyplot probe for Qt/GTK/wx toolkits on import, unless a
+        # backend was chosen through MPLBACKEND or a matplotlibrc.
+        if matplotlib.rcParams._get_backend_or_none() is None:
+            matplotlib.use("TkAgg")
+
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+
+# Schedule columns as arrays, extracted in one pass and shared by the plots
+ScheduleData = namedtuple(
+    "ScheduleData", ["period", "start", "order", "demand", "emergency", "end", "cost"]
+)
+
+
+def schedule_data(schedule):
+    """
+    Split a solver schedule (a SCHEDULE_DTYPE record array) into parallel
+    1-D arrays. Its fields are strided views into the records, so each one
+    is copied once into a contiguous column for the plots.
+    """
+    return ScheduleData(*(np.ascontiguousarray(schedule[c]) for c in SCHEDULE_COLUMNS))
 
 class PlotManager:
     """Manages all plotting and visualization for the inventory optimization system."""
@@ -13,6 +50,8 @@ class PlotManager:
             parent_gui: Reference to parent InventoryGUI instance
         """
         self.parent = parent_gui
+        # (figure, axes) per plot type, reused while its window stays open
+        self._figs = {}
     
     def check_data(self):
         """Verify that optimization has been run before plotting."""
@@ -21,6 +60,22 @@ class PlotManager:
             return False
         return True
 
+    def _axes(self, name, nrows=1, ncols=1, **kwargs):
+        """
+        Figure and axes for one plot type. A plot whose window is still open
+        is cleared and redrawn in place instead of opening another figure;
+        closing the window lets the next call create a fresh one.
+        """
+        plt = _pyplot()
+        fig, axes = self._figs.get(name, (None, None))
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig, axes = plt.subplots(nrows, ncols, **kwargs)
+            self._figs[name] = (fig, axes)
+        else:
+            for ax in np.ravel(axes):
+                ax.clear()
+        return fig, axes
+
     def _get_max_capacity(self):
         """Helper to safely get max storage from the GUI input for scaling."""
         try:
@@ -29,105 +84,111 @@ class PlotManager:
         except (ValueError, AttributeError):
             # Fallback: find the highest number in the current data
             max_inv = 0
-            if self.parent.current_schedule:
-                max_inv = max(s['Start'] for s in self.parent.current_schedule)
+            if self.parent.current_data is not None:
+                max_inv = int(self.parent.current_data.start.max())
             return max(max_inv, 10) # Default minimum of 10
 
     def plot_demand(self):
         """Plot demand over time."""
         if not self.check_data(): return
+        plt = _pyplot()
         
-        demands = self.parent.current_demand
-        periods = range(1, len(demands) + 1)
+        demands = np.asarray(self.parent.current_demand)
+        periods = np.arange(1, len(demands) + 1)
             
-        plt.figure()
-        plt.plot(periods, demands, marker="o")
-        plt.title("Demand Over Time")
-        plt.xlabel("Month")
-        plt.ylabel("Units")
-        plt.xticks(periods)
-        plt.grid(True)
+        fig, ax = self._axes("demand")
+        ax.plot(periods, demands, marker="o")
+        ax.set_title("Demand Over Time")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Units")
+        ax.set_xticks(periods)
+        ax.grid(True)
+        fig.canvas.draw_idle()
         plt.show()
     
     def plot_inventory(self):
         """Plot inventory levels over time."""
         if not self.check_data(): return
+        plt = _pyplot()
             
-        inventory = [s["Start"] for s in self.parent.current_schedule]
+        data = self.parent.current_data
         # Append end state for the step plot
-        inventory.append(self.parent.current_schedule[-1]["End"])
-        periods = range(1, len(inventory) + 1)
+        inventory = np.append(data.start, data.end[-1])
+        periods = np.arange(1, len(inventory) + 1)
 
         # Get max capacity for plotting limits
         max_cap = self._get_max_capacity()
 
-        plt.figure()
-        plt.step(periods, inventory, where="post")
+        fig, ax = self._axes("inventory")
+        ax.step(periods, inventory, where="post")
         
         # Set Y-limit to show full warehouse capacity
-        plt.ylim(0, max_cap * 1.1) 
-        plt.axhline(y=max_cap, color='r', linestyle='--', label='Max Capacity')
-        
-        plt.title("Inventory Level vs Capacity")
-        plt.xlabel("Month")
-        plt.ylabel("Units")
-        plt.legend()
-        plt.grid(True)
+        ax.set_ylim(0, max_cap * 1.1) 
+        ax.axhline(y=max_cap, color='r', linestyle='--', label='Max Capacity')
+        
+        ax.set_title("Inventory Level vs Capacity")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Units")
+        ax.legend()
+        ax.grid(True)
+        fig.canvas.draw_idle()
         plt.show()
     
     def plot_emergency(self):
         """Plot emergency orders over time."""
         if not self.check_data(): return
+        plt = _pyplot()
             
-        emergency = [s["Emergency"] for s in self.parent.current_schedule]
-        periods = [s["Period"] for s in self.parent.current_schedule]
-        
-        plt.figure()
-        plt.bar(periods, emergency)
-        plt.title("Emergency Orders Over Time")
-        plt.xlabel("Month")
-        plt.ylabel("Units")
-        plt.xticks(periods)
-        plt.grid(True)
+        data = self.parent.current_data
+        periods = data.period
+        
+        fig, ax = self._axes("emergency")
+        ax.bar(periods, data.emergency)
+        ax.set_title("Emergency Orders Over Time")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Units")
+        ax.set_xticks(periods)
+        ax.grid(True)
+        fig.canvas.draw_idle()
         plt.show()
     
     def plot_costs(self):
         """Plot costs per period."""
         if not self.check_data(): return
+        plt = _pyplot()
             
-        costs = [s["Cost"] for s in self.parent.current_schedule]
-        periods = [s["Period"] for s in self.parent.current_schedule]
-        
-        plt.figure()
-        plt.plot(periods, costs, marker="o")
-        plt.title("Cost Per Period")
-        plt.xlabel("Month")
-        plt.ylabel("Cost ($)")
-        plt.xticks(periods)
-        plt.grid(True)
+        data = self.parent.current_data
+        periods = data.period
+        
+        fig, ax = self._axes("costs")
+        ax.plot(periods, data.cost, marker="o")
+        ax.set_title("Cost Per Period")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Cost ($)")
+        ax.set_xticks(periods)
+        ax.grid(True)
+        fig.canvas.draw_idle()
         plt.show()
     
     def show_backtracking(self):
         """Visualize the backtracking path: Start -> After Order -> End Inventory."""
         if not self.check_data():
             return
+        plt = _pyplot()
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._axes("backtracking", figsize=(12, 6))
 
         # Access data from parent
-        schedule = self.parent.current_schedule
+        data = self.parent.current_data
         max_storage = self._get_max_capacity()
 
-        periods = [s["Period"] for s in schedule]
-        start_inv = [s["Start"] for s in schedule]
-        orders = [s["Order"] for s in schedule]
-        end_inv = [s["End"] for s in schedule]
+        periods = data.period
+        start_inv = data.start
+        orders = data.order
+        end_inv = data.end
         
         # Calculate 'After Order' level (clamped by max storage for visualization)
-        after_order = [
-            min(s["Start"] + s["Order"], max_storage)
-            for s in schedule
-        ]
+        after_order = np.minimum(start_inv + orders, max_storage)
 
         # Plot lines
         ax.plot(periods, start_inv, 'o-', label='Start Inventory', linewidth=2, color='blue')
@@ -143,18 +204,18 @@ class PlotManager:
             label='Max Storage'
         )
 
-        # Annotate orders
-        for i, (p, q) in enumerate(zip(periods, orders)):
-            if q > 0:
-                ax.annotate(
-                    f'+{q}',
-                    xy=(p, after_order[i]),
-                    xytext=(0, 10),
-                    textcoords='offset points',
-                    ha='center',
-                    fontsize=8,
-                    bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.7)
-                )
+        # Annotate orders (only the periods that actually order)
+        order_box = dict(boxstyle='round', facecolor='yellow', alpha=0.7)
+        for i in np.flatnonzero(orders):
+            ax.annotate(
+                f'+{orders[i]}',
+                xy=(periods[i], after_order[i]),
+                xytext=(0, 10),
+                textcoords='offset points',
+                ha='center',
+                fontsize=8,
+                bbox=order_box
+            )
 
         ax.set_xlabel('Period')
         ax.set_ylabel('Inventory Level')
@@ -163,7 +224,8 @@ class PlotManager:
         ax.grid(True, alpha=0.3)
         ax.set_ylim(bottom=0)  # Ensure y-axis starts at 0
 
-        plt.tight_layout()
+        fig.tight_layout()
+        fig.canvas.draw_idle()
         plt.show()
     
     def plot_comparison(self):
@@ -171,14 +233,17 @@ class PlotManager:
         if self.parent.greedy_schedule is None:
             messagebox.showwarning("No Data", "Please run optimization first.")
             return
+        plt = _pyplot()
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._axes("comparison", 2, 2, figsize=(14, 10))
         
-        periods = [s["Period"] for s in self.parent.current_schedule]
+        dp = self.parent.current_data
+        greedy = self.parent.greedy_data
+        periods = dp.period
         
         # Plot 1: Cost per period
-        dp_costs = [s["Cost"] for s in self.parent.current_schedule]
-        greedy_costs = [s["Cost"] for s in self.parent.greedy_schedule]
+        dp_costs = dp.cost
+        greedy_costs = greedy.cost
         
         ax1.plot(periods, dp_costs, 'o-', label='DP', linewidth=2, markersize=8)
         ax1.plot(periods, greedy_costs, 's--', label='Greedy', linewidth=2, markersize=8)
@@ -203,8 +268,8 @@ class PlotManager:
         ax2.grid(True, alpha=0.3)
         
         # Plot 3: Orders per period
-        dp_orders = [s["Order"] for s in self.parent.current_schedule]
-        greedy_orders = [s["Order"] for s in self.parent.greedy_schedule]
+        dp_orders = dp.order
+        greedy_orders = greedy.order
         
         x = np.arange(len(periods))
         width = 0.35
@@ -223,13 +288,13 @@ class PlotManager:
         metrics = ['Total Cost', 'Num Orders', 'Emergencies']
         dp_metrics = [
             self.parent.current_cost / 100,  # Scale for visibility
-            sum(1 for s in self.parent.current_schedule if s["Order"] > 0),
-            sum(1 for s in self.parent.current_schedule if s["Emergency"] > 0)
+            np.count_nonzero(dp.order),
+            np.count_nonzero(dp.emergency)
         ]
         greedy_metrics = [
             self.parent.greedy_cost / 100,
-            sum(1 for s in self.parent.greedy_schedule if s["Order"] > 0),
-            sum(1 for s in self.parent.greedy_schedule if s["Emergency"] > 0)
+            np.count_nonzero(greedy.order),
+            np.count_nonzero(greedy.emergency)
         ]
         
         x_metrics = np.arange(len(metrics))
@@ -242,5 +307,6 @@ class PlotManager:
         ax4.legend()
         ax4.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
+        fig.tight_layout()
+        fig.canvas.draw_idle()
         plt.show()
\ No newline at end of file
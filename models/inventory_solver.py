@@ -1,5 +1,340 @@
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy kernel is used instead
+    njit = None
+
+
+# Upper bound on (I, q) cells evaluated at once, to keep the temporaries of
+# the full-scan sweep small for large storage capacities.
+_BLOCK_CELLS = 1 << 20
+
+# Cost totals must stay below this for the int64 path; the headroom up to
+# the int64 limit covers the sums formed for masked (infeasible) orders.
+_INT64_COST_LIMIT = 1 << 62
+
+
+# One record per period, as returned by backtrack() and solve_greedy().
+# Records are stored together, so a field (schedule["Cost"], ...) is a
+# strided view, not a contiguous column.
+SCHEDULE_DTYPE = np.dtype([
+    ("Period", np.int64),
+    ("Start", np.int64),
+    ("Order", np.int64),
+    ("Demand", np.int64),
+    ("Emergency", np.int64),
+    ("End", np.int64),
+    ("Cost", np.float64),
+])
+
+
+def _cost_dtype(*costs):
+    """int64 when every cost parameter is an int (exact DP arithmetic), else float64."""
+    if all(isinstance(c, (int, np.integer)) for c in costs):
+        return np.int64
+    return np.float64
+
+
+def _infeasible(dtype):
+    """
+    Cost given to infeasible orders in a table of the given dtype: the
+    largest int64, or inf for floats. Either lies above every total the
+    sweep can produce (the int64 path is only taken when the cost bound
+    fits well below it), so masked cells never win the argmin.
+    """
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).max
+    return np.inf
+
+
+def _max_orders(I, d, max_storage, remaining=None):
+    """
+    Largest order worth considering from inventory I.
+
+    LOGIC:
+    1. Theoretical Max: We can order enough to meet demand + fill storage.
+    2. Physical Limit: We cannot receive more than 'max_storage' in one shipment.
+    3. Pruning (when remaining is given): never order beyond the demand left
+       in the horizon. Ordering only up to it covers every remaining period
+       with a lower order and storage bill, so with non-negative costs
+       (checked by InventoryDPSolver.solve()) larger orders can never be
+       (the smallest) optimal.
+    """
+    max_q = np.minimum(d + max_storage - I, max_storage)
+    if remaining is not None:
+        max_q = np.minimum(max_q, remaining - I)
+    return np.maximum(0, max_q)
+
+
+def _stage_costs(v, d, max_storage, future, c_storage,
+                 c_emergency_fixed, c_emergency_unit):
+    """
+    Cost of a period entered with stock v = I + q against demand d, plus the
+    cost-to-go of the level it ends at, not counting the order itself.
+    Branchless over v: shortages pay the emergency charge (masked in where
+    short > 0), covered demand pays storage on what is left. Ending levels
+    past max_storage are clipped; callers mask those orders as infeasible.
+    """
+    short = np.maximum(d - v, 0)
+    nxt = np.clip(v - d, 0, max_storage)
+    return np.where(short > 0, c_emergency_fixed + c_emergency_unit * short, 0) \
+        + c_storage * nxt + future[nxt]
+
+
+def _range_argmin(g, lo, hi):
+    """Leftmost argmin of g over each window [lo[i], hi[i]] (sparse table)."""
+    n = len(g)
+    table = [np.arange(n)]
+    span = 1
+    while 2 * span <= n:
+        prev = table[-1]
+        left = prev[:n - 2 * span + 1]
+        right = prev[span:n - span + 1]
+        table.append(np.where(g[left] <= g[right], left, right))
+        span *= 2
+
+    level = np.frexp(hi - lo + 1)[1] - 1
+    a = np.empty(len(lo), dtype=np.int64)
+    b = np.empty(len(lo), dtype=np.int64)
+    for k in np.unique(level):
+        rows = level == k
+        a[rows] = table[k][lo[rows]]
+        b[rows] = table[k][hi[rows] - (1 << k) + 1]
+    return np.where(g[a] <= g[b], a, b)
+
+
+def _solve_dp_numpy(demand, max_storage, c_order_fixed, c_unit, c_storage,
+                    c_emergency_fixed, c_emergency_unit, decision, dp=None):
+    """
+    Backward induction kernel, filling decision[:-1] in place.
+
+    Rather than scanning every order q, each state I compares a handful of
+    candidates, vectorized over all states of a period:
+    - q = 0;
+    - orders that still leave a shortage (0 < q < d - I): they all end at
+      zero inventory and cost c_order_fixed + (c_unit - c_emergency_unit) * q
+      more than q = 0, so with c_order_fixed >= 0 only the largest such q
+      can win, and only when emergency units cost more than regular ones.
+      Otherwise (e.g. zero unit costs) the shortage range is skipped
+      entirely (InventoryDPSolver.solve() rejects negative costs);
+    - orders that cover demand: with r = I + q - d the cost is
+      c_order_fixed + c_unit * (d - I) + g(r), g(r) = (c_unit + c_storage) * r
+      + future[r], so the best one is the minimum of g over the window of
+      reachable r, found with a sparse table.
+    Candidates are compared in increasing q with a strict <, so ties still
+    go to the smallest order, as in the full scan (_solve_dp_full_scan).
+
+    Period t only reads the cost row of period t + 1, so the sweep rolls two
+    rows and returns the t=0 row. The full cost table is written to dp only
+    when one is passed in.
+    """
+    T = len(demand)
+    S = max_storage
+    I = np.arange(S + 1)
+    remaining = np.cumsum(demand[::-1])[::-1]
+    dtype = _cost_dtype(c_order_fixed, c_unit, c_storage,
+                        c_emergency_fixed, c_emergency_unit)
+
+    future = np.zeros(S + 1, dtype=dtype)
+    current = np.empty(S + 1, dtype=dtype)
+    shortage_pays = c_emergency_unit > c_unit
+
+    for t in range(T - 1, -1, -1):
+        d = demand[t]
+        max_q = _max_orders(I, d, S, remaining[t])
+
+        # q = 0
+        best = _stage_costs(I, d, S, future, c_storage,
+                            c_emergency_fixed, c_emergency_unit)
+        best_q = np.zeros(S + 1, dtype=np.int64)
+
+        # Largest order that still leaves a shortage
+        if shortage_pays:
+            q = np.minimum(d - I - 1, max_q)
+            val = (c_order_fixed + c_unit * q) \
+                + (c_emergency_fixed + c_emergency_unit * (d - I - q)) + future[0]
+            better = (q >= 1) & (val < best)
+            best = np.where(better, val, best)
+            best_q = np.where(better, q, best_q)
+
+        # Orders covering demand: best ending inventory r in [lo, hi]
+        lo = np.maximum(I - d + 1, 0)
+        hi = I + max_q - d
+        covered = lo <= hi
+        if covered.any():
+            g = (c_unit + c_storage) * np.arange(S + 1) + future
+            r = _range_argmin(g, lo[covered], hi[covered])
+            q = r + d - I[covered]
+            val = (c_order_fixed + c_unit * q) + c_storage * r + future[r]
+            better = val < best[covered]
+            best[covered] = np.where(better, val, best[covered])
+            best_q[covered] = np.where(better, q, best_q[covered])
+
+        current[:] = best
+        decision[t] = best_q
+
+        if dp is not None:
+            dp[t] = current
+        future, current = current, future
+
+    return future
+
+
+def _solve_dp_full_scan(demand, max_storage, c_order_fixed, c_unit, c_storage,
+                        c_emergency_fixed, c_emergency_unit, decision, dp=None):
+    """
+    Reference kernel that evaluates every feasible order.
+
+    Each period is tabulated as a whole (I, q) grid with NumPy and reduced
+    along q; argmin keeps the smallest optimal order. Same interface as
+    _solve_dp_numpy; used by solve(full_scan=True) to check the fast kernels,
+    so it applies none of their pruning (not even the remaining-demand cap).
+    """
+    T = len(demand)
+    S = max_storage
+    q = np.arange(S + 1)
+    order_cost = np.where(q > 0, c_order_fixed + c_unit * q, 0)
+    block = max(1, _BLOCK_CELLS // (S + 1))
+    dtype = _cost_dtype(c_order_fixed, c_unit, c_storage,
+                        c_emergency_fixed, c_emergency_unit)
+    infeasible = _infeasible(dtype)
+
+    future = np.zeros(S + 1, dtype=dtype)
+    current = np.empty(S + 1, dtype=dtype)
+
+    for t in range(T - 1, -1, -1):
+        d = demand[t]
+        # Everything but the order cost depends on the stock level I + q
+        # only, so tabulate it once per period over all 2S + 1 levels
+        stage = _stage_costs(np.arange(2 * S + 1), d, S, future, c_storage,
+                             c_emergency_fixed, c_emergency_unit)
+
+        for lo in range(0, S + 1, block):
+            hi = min(lo + block, S + 1)
+            I = np.arange(lo, hi)[:, None]
+            valid = q <= _max_orders(I, d, S)
+
+            cost = order_cost + stage[I + q]
+            cost[~valid] = infeasible
+
+            best_q = cost.argmin(axis=1)
+            decision[t, lo:hi] = best_q
+            current[lo:hi] = cost[np.arange(hi - lo), best_q]
+
+        if dp is not None:
+            dp[t] = current
+        future, current = current, future
+
+    return future
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _dp_kernel(demand, remaining, max_storage, c_order_fixed, c_unit, c_storage,
+                   c_emergency_fixed, c_emergency_unit, future, current,
+                   decision, dp, keep_table):
+        """
+        Compiled scalar version of _solve_dp_numpy.
+
+        The covering-demand windows [lo, hi] only move right as I grows, so
+        a monotone queue of ending inventories gives each window's leftmost
+        minimum of g in amortized O(1).
+        """
+        T = demand.shape[0]
+        S = max_storage
+        g = np.empty_like(future)
+        queue = np.empty(S + 1, dtype=np.int64)
+        shortage_pays = c_emergency_unit > c_unit
+
+        for t in range(T - 1, -1, -1):
+            d = demand[t]
+            for r in range(S + 1):
+                g[r] = (c_unit + c_storage) * r + future[r]
+            head = 0
+            tail = 0
+            pushed = 0
+
+            for I in range(S + 1):
+                max_q = max(0, min(d + S - I, S, remaining[t] - I))
+
+                # q = 0
+                if I >= d:
+                    best = c_storage * (I - d) + future[I - d]
+                else:
+                    best = c_emergency_fixed + c_emergency_unit * (d - I) + future[0]
+                best_q = 0
+
+                # Largest order that still leaves a shortage
+                q = min(d - I - 1, max_q)
+                if shortage_pays and q >= 1:
+                    val = (c_order_fixed + c_unit * q) \
+                        + (c_emergency_fixed + c_emergency_unit * (d - I - q)) + future[0]
+                    if val < best:
+                        best = val
+                        best_q = q
+
+                # Orders covering demand: best ending inventory r in [lo, hi]
+                lo = max(I - d + 1, 0)
+                hi = I + max_q - d
+                if lo <= hi:
+                    while pushed <= hi:
+                        while tail > head and g[queue[tail - 1]] > g[pushed]:
+                            tail -= 1
+                        queue[tail] = pushed
+                        tail += 1
+                        pushed += 1
+                    while queue[head] < lo:
+                        head += 1
+
+                    r = queue[head]
+                    q = r + d - I
+                    val = (c_order_fixed + c_unit * q) + c_storage * r + future[r]
+                    if val < best:
+                        best = val
+                        best_q = q
+
+                current[I] = best
+                decision[t, I] = best_q
+
+            if keep_table:
+                dp[t, :] = current
+            future, current = current, future
+
+        return future
+
+    def _solve_dp_numba(demand, max_storage, c_order_fixed, c_unit, c_storage,
+                        c_emergency_fixed, c_emergency_unit, decision, dp=None):
+        """Run the compiled kernel with the same interface as _solve_dp_numpy."""
+        remaining = np.cumsum(demand[::-1])[::-1]
+        dtype = _cost_dtype(c_order_fixed, c_unit, c_storage,
+                            c_emergency_fixed, c_emergency_unit)
+        return _dp_kernel(
+            demand, remaining, max_storage,
+            c_order_fixed, c_unit, c_storage,
+            c_emergency_fixed, c_emergency_unit,
+            np.zeros(max_storage + 1, dtype=dtype),
+            np.empty(max_storage + 1, dtype=dtype),
+            decision, np.empty((0, 0), dtype=dtype) if dp is None else dp,
+            dp is not None
+        )
+
+    _solve_dp = _solve_dp_numba
+else:
+    _solve_dp = _solve_dp_numpy
+
+
+def _reuse_table(table, shape, dtype):
+    """
+    Return table if it already has the given shape and dtype, else a new
+    zero array. The kernels overwrite rows 0..T-1 on every solve and never
+    touch the last row, so a reused table keeps its zero terminal row.
+    """
+    if table is not None and table.shape == shape and table.dtype == dtype:
+        return table
+    return np.zeros(shape, dtype=dtype)
+
+
 class InventoryDPSolver:
     """
     Dynamic Programming solver for medical inventory optimization.
@@ -11,7 +346,8 @@ class InventoryDPSolver:
                  c_emergency_fixed, c_emergency_unit):
         """Initialize the solver with problem parameters."""
         self.T = T
-        self.demand = demand
+        # Contiguous int64 copy: the kernels index it directly per period
+        self.demand = np.asarray(demand, dtype=np.int64)
         self.max_storage = max_storage
         self.initial_inventory = initial_inventory
 
@@ -23,7 +359,9 @@ class InventoryDPSolver:
         self.c_emergency_unit = c_emergency_unit
 
         self.dp = None
+        self.dp0 = None
         self.decision = None
+        self._solved_problem = None
     
     def normal_order_cost(self, n):
         """Calculate cost of a normal order."""
@@ -37,103 +375,172 @@ class InventoryDPSolver:
         """Calculate storage cost."""
         return self.c_storage * n
 
-    def solve(self):
-            """
-            Solve using Dynamic Programming.
-            Logic: Backward induction with 'Receiving Limit' constraint.
-            """
-            INF = float('inf')
-            self.dp = np.full((self.T + 1, self.max_storage + 1), INF)
-            self.decision = np.zeros((self.T + 1, self.max_storage + 1), dtype=int)
-            
-            # Terminal condition
-            self.dp[self.T, :] = 0
-
-            # Backward induction
-            for t in range(self.T - 1, -1, -1):
-                current_demand = self.demand[t]
-
-                for I in range(self.max_storage + 1):
-                    best = INF
-                    best_q = 0
-                    
-                    # LOGIC:
-                    # 1. Theoretical Max: We can order enough to meet demand + fill storage.
-                    # 2. Physical Limit: We cannot receive more than 'max_storage' in one shipment.
-                    
-                    theoretical_max = current_demand + self.max_storage - I
-                    receiving_limit = self.max_storage
-                    
-                    # The actual limit is the stricter of the two
-                    max_q = min(theoretical_max, receiving_limit)
-                    max_q = max(0, max_q) # Safety check
-
-                    for q in range(max_q + 1):
-                        cost, nxt = self._period_cost(I, q, t)
-                        
-                        # CONSTRAINT: Ending inventory must fit in storage
-                        if nxt > self.max_storage:
-                            continue
-                        
-                        val = cost + self.dp[t + 1, nxt]
-                        
-                        if val < best:
-                            best = val
-                            best_q = q
-                            
-                    self.dp[t, I] = best
-                    self.decision[t, I] = best_q
-
-    def _period_cost(self, I, q, t):
-        """Calculate cost for a single period."""
-        demand = self.demand[t]
-        inv = I + q
-        cost = self.normal_order_cost(q)
-
-        if inv >= demand:
-            rem = inv - demand
-            cost += self.storage_cost(rem)
+    def solve(self, keep_table=True, full_scan=False):
+        """
+        Solve using Dynamic Programming.
+        Logic: Backward induction with 'Receiving Limit' constraint.
+
+        With keep_table=False only the t=0 cost row is kept (O(S) instead of
+        O(T*S) floats) and self.dp stays None; the decision table is always
+        kept in full since backtracking needs it.
+
+        full_scan=True evaluates every feasible order instead of the
+        candidate orders only; it is slower and meant for checking results.
+
+        Calling solve() again on an unchanged problem reuses the tables from
+        the previous call instead of redoing the sweep. After a change, the
+        existing dp/decision arrays are overwritten in place when their shape
+        and dtype still fit; clear_cache() releases them.
+        """
+        self._check_costs()
+        problem = self._problem_key()
+        if (not full_scan and problem == self._solved_problem and self.dp0 is not None
+                and (self.dp is not None or not keep_table)):
+            if not keep_table:
+                self.dp = None
+            return
+
+        shape = (self.T + 1, self.max_storage + 1)
+        costs = self._kernel_costs()
+
+        # Orders never exceed max_storage: int16 holds them up to 32767.
+        # Kept signed so arithmetic like I + decision[t, I] cannot wrap.
+        fits_int16 = self.max_storage <= np.iinfo(np.int16).max
+        self.decision = _reuse_table(
+            self.decision, shape, np.int16 if fits_int16 else np.int32
+        )
+
+        if keep_table:
+            self.dp = _reuse_table(self.dp, shape, _cost_dtype(*costs))
         else:
-            shortage = demand - inv
-            cost += self.emergency_order_cost(shortage)
-            rem = 0
+            self.dp = None
 
-        return cost, rem
+        kernel = _solve_dp_full_scan if full_scan else _solve_dp
+        self.dp0 = kernel(
+            self.demand, self.max_storage, *costs,
+            self.decision, self.dp
+        )
+        self._solved_problem = problem
 
-    def backtrack(self):
-        """Generate optimal schedule from DP solution."""
-        schedule = []
-        I = self.initial_inventory
-        
+    def clear_cache(self):
+        """Drop the solved tables, so the next solve() starts from fresh arrays."""
+        self.dp = None
+        self.dp0 = None
+        self.decision = None
+        self._solved_problem = None
+
+    def _check_costs(self):
+        """
+        The fast kernels never order beyond the demand left in the horizon
+        and skip shortage orders unless emergency units cost more than
+        regular ones. Both prunings are only exact for non-negative costs
+        (a negative fixed order cost would make a one-unit order beat none),
+        so reject negative ones.
+        """
+        costs = {
+            "Ordering Fixed Cost": self.c_order_fixed,
+            "Ordering Unit Cost": self.c_unit,
+            "Storage Cost": self.c_storage,
+            "Emergency Fixed Cost": self.c_emergency_fixed,
+            "Emergency Unit Cost": self.c_emergency_unit,
+        }
+        for name, c in costs.items():
+            if c < 0:
+                raise ValueError(f"{name} cannot be negative, got {c}.")
+
+    def _kernel_costs(self):
+        """
+        Cost parameters as passed to the DP kernels.
+        Whole-number costs (the GUI reads every cost as a float) are handed
+        over as ints, so the tables are int64 and every sum is exact, as long
+        as a bound on the horizon total fits; larger problems run in float64.
+        """
+        costs = (
+            self.c_order_fixed, self.c_unit, self.c_storage,
+            self.c_emergency_fixed, self.c_emergency_unit
+        )
+        if not all(float(c).is_integer() for c in costs):
+            return costs
+
+        c_order_fixed, c_unit, c_storage, c_emergency_fixed, c_emergency_unit = \
+            (int(c) for c in costs)
+        S = self.max_storage
+        max_demand = int(self.demand.max()) if self.demand.size else 0
+        # Worst period: a full order, full storage and an all-emergency demand
+        bound = self.T * (
+            c_order_fixed + c_unit * S + c_storage * S
+            + c_emergency_fixed + c_emergency_unit * max_demand
+        )
+        if bound < _INT64_COST_LIMIT:
+            return c_order_fixed, c_unit, c_storage, c_emergency_fixed, c_emergency_unit
+        return tuple(float(c) for c in costs)
+
+    def _problem_key(self):
+        """Everything the DP tables depend on (not the initial inventory)."""
+        return (
+            self.demand.tobytes(), self.max_storage,
+            self.c_order_fixed, self.c_unit, self.c_storage,
+            self.c_emergency_fixed, self.c_emergency_unit
+        )
+
+    def optimal_cost(self, initial_inventory=None):
+        """
+        Optimal total cost starting from the given inventory level.
+        The DP table covers every starting level, so other initial inventories
+        can be queried without re-solving as long as demand, costs and
+        max_storage are unchanged.
+        """
+        initial_inventory = self._start_level(initial_inventory)
+        return float(self.dp0[initial_inventory])
+
+    def _start_level(self, initial_inventory):
+        """
+        Resolve and check the starting inventory for a query on the solved
+        tables: defaults to self.initial_inventory and must lie in
+        [0, max_storage], the range the tables cover.
+        """
+        if self.dp0 is None or self.decision is None:
+            raise RuntimeError("No DP solution yet: call solve() first.")
+        if initial_inventory is None:
+            initial_inventory = self.initial_inventory
+        if not 0 <= initial_inventory <= self.max_storage:
+            raise ValueError(
+                f"Initial inventory must be between 0 and {self.max_storage}, "
+                f"got {initial_inventory}."
+            )
+        return initial_inventory
+
+    def backtrack(self, initial_inventory=None):
+        """
+        Generate optimal schedule from DP solution.
+        Defaults to the solver's initial inventory; pass another level to
+        reuse the same solve for a different starting point.
+        """
+        initial_inventory = self._start_level(initial_inventory)
+
+        start = np.empty(self.T, dtype=np.int64)
+        order = np.empty(self.T, dtype=np.int64)
+        I = initial_inventory
+
+        # Bind per-period lookups to locals once, outside the loop
+        decision = self.decision
+        demand = self.demand.tolist()
+
+        # Only the state walk is sequential: follow the stored decisions
         for t in range(self.T):
-            q = self.decision[t, I]
-            inv = I + q
-            d = self.demand[t]
-
-            if inv >= d:
-                emergency = 0
-                end = inv - d
-            else:
-                emergency = d - inv
-                end = 0
-
-            schedule.append({
-                "Period": t,
-                "Start": I,
-                "Order": q,
-                "Demand": d,
-                "Emergency": emergency,
-                "End": end,
-                "Cost": (
-                    self.normal_order_cost(q)
-                    + self.emergency_order_cost(emergency)
-                    + self.storage_cost(end)
-                )
-            })
-
-            I = end
-
-        return schedule, self.dp[0, self.initial_inventory]
+            q = int(decision[t, I])
+            start[t] = I
+            order[t] = q
+            I = max(I + q - demand[t], 0)
+
+        # Everything else follows from the path elementwise
+        after_order = start + order
+        emergency = np.maximum(self.demand - after_order, 0)
+        end = np.maximum(after_order - self.demand, 0)
+
+        cost = self._period_costs(order, emergency, end)
+        schedule = self._build_schedule(start, order, emergency, end, cost)
+        return schedule, self.optimal_cost(initial_inventory)
 
     def solve_greedy(self):
         """
@@ -141,54 +548,52 @@ class InventoryDPSolver:
         Logic: Try to meet demand 'd'. If 'd' is huge, order max possible (Receiving Limit)
         and pay emergency for the rest.
         """
-        schedule = []
-        total_cost = 0
-        I = self.initial_inventory
-        
-        for t in range(self.T):
-            d = self.demand[t]
-            
-            # Step 1: Calculate target order (just enough to meet demand)
-            target = max(0, d - I)
-            
-            # Step 2: Apply Receiving Limit (Constraint A)
-            # We cannot order more than max_storage in one go
-            q = min(target, self.max_storage)
-            
-            # Step 3: Apply Ending Storage Check (Constraint B)
-            # (Rarely needed for Greedy, but checks if I + q - d > max_storage)
-            # If we have excess inventory start, we might overshoot.
-            max_allowed_for_storage = self.max_storage + d - I
-            q = min(q, max_allowed_for_storage)
-            
-            # Final safe non-negative check
-            q = max(0, q)
-            
-            # Calculate costs
-            inv = I + q
-            cost = self.normal_order_cost(q)
-            
-            if inv >= d:
-                emergency = 0
-                end = inv - d
-            else:
-                emergency = d - inv
-                cost += self.emergency_order_cost(emergency)
-                end = 0
-            
-            cost += self.storage_cost(end)
-            total_cost += cost
-            
-            schedule.append({
-                "Period": t,
-                "Start": I,
-                "Order": q,
-                "Demand": d,
-                "Emergency": emergency,
-                "End": end,
-                "Cost": cost
-            })
-            
-            I = end
+        demand = self.demand
+        max_storage = self.max_storage
+
+        # Step 1: Target order is just enough to meet demand, so any starting
+        # stock below demand is used up and the greedy never carries stock
+        # forward; only the initial inventory drains across periods.
+        used_before = np.concatenate(([0], np.cumsum(demand)[:-1]))
+        start = np.maximum(self.initial_inventory - used_before, 0)
+        end = np.maximum(start - demand, 0)
+        shortfall = np.maximum(demand - start, 0)
+
+        # Step 2: Apply Receiving Limit (Constraint A)
+        # We cannot order more than max_storage in one go
+        order = np.minimum(shortfall, max_storage)
+
+        # Step 3: Ending Storage Check (Constraint B) never binds: the order
+        # stops at demand, so the period ends empty whenever it orders.
+        # Whatever the receiving limit cuts off goes to emergency.
+        emergency = shortfall - order
         
-        return schedule, total_cost
\ No newline at end of file
+        # Costs for all periods at once, once the inventory path is known
+        cost = self._period_costs(order, emergency, end)
+        schedule = self._build_schedule(start, order, emergency, end, cost)
+        return schedule, cost.sum()
+
+    def _period_costs(self, order, emergency, end):
+        """
+        Per-period costs of a whole schedule, as one float array.
+        Vectorized counterpart of normal_order_cost + emergency_order_cost
+        + storage_cost, with the fixed charges masked in where n > 0.
+        """
+        return (
+            np.where(order > 0, self.c_order_fixed + self.c_unit * order, 0.0)
+            + np.where(emergency > 0,
+                       self.c_emergency_fixed + self.c_emergency_unit * emergency, 0.0)
+            + self.c_storage * end
+        )
+
+    def _build_schedule(self, start, order, emergency, end, cost):
+        """Pack per-period result arrays into a SCHEDULE_DTYPE record array."""
+        schedule = np.empty(self.T, dtype=SCHEDULE_DTYPE)
+        schedule["Period"] = np.arange(self.T)
+        schedule["Start"] = start
+        schedule["Order"] = order
+        schedule["Demand"] = self.demand
+        schedule["Emergency"] = emergency
+        schedule["End"] = end
+        schedule["Cost"] = cost
+        return schedule